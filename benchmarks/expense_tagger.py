@@ -0,0 +1,120 @@
+"""
+Benchmark expense tagging throughput as the number of rules grows.
+
+Compares ExpenseTagger (cold and warm merchant cache) against checking each
+rule's regex in turn, over synthetic merchant descriptions.
+
+    $ PYTHONPATH=. python benchmarks/expense_tagger.py
+"""
+
+import random
+import re
+import string
+import time
+from argparse import ArgumentParser
+
+from tdbank_statement_parser.expense_tagger import ExpenseTagger, normalize_merchant
+
+random.seed(0)
+
+
+def random_word(n: int) -> str:
+    return "".join(random.choices(string.ascii_uppercase, k=n))
+
+
+def make_rules(n_rules: int, regex_share: float) -> dict:
+    rules = {}
+    for i in range(n_rules):
+        keyword = f"{random_word(random.randint(4, 8))} {random_word(3)}"
+        if random.random() < regex_share:
+            keyword = "re:\\b" + keyword.replace(" ", r"\s+") + "\\b"
+        rules.setdefault(f"tag_{i % 50}", []).append(keyword)
+    return rules
+
+
+def make_records(rules: dict, n_records: int, n_merchants: int) -> list:
+    keywords = [
+        p.removeprefix("re:").replace(r"\s+", " ").replace(r"\b", "")
+        for patterns in rules.values()
+        for p in patterns
+    ]
+    merchants = [
+        (
+            f"{random.choice(keywords)} {random.randint(100, 999)}"
+            if random.random() < 0.7
+            else f"{random_word(6)} {random_word(5)}"
+        )
+        for _ in range(n_merchants)
+    ]
+    return [
+        {"parsed_desc": {"authorization_location": random.choice(merchants)}}
+        for _ in range(n_records)
+    ]
+
+
+def naive_tag(compiled: list, record: dict) -> str:
+    merchant = normalize_merchant(record["parsed_desc"]["authorization_location"])
+    for tag, rgx in compiled:
+        if rgx.search(merchant):
+            return tag
+
+
+def rate(f, records: list) -> float:
+    start = time.perf_counter()
+    for record in records:
+        f(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main():
+    parser = ArgumentParser(description="Expense tagger throughput benchmark.")
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--merchants", type=int, default=2_000)
+    parser.add_argument("--regex-share", type=float, default=0.1)
+    parser.add_argument(
+        "--rules", type=int, nargs="+", default=[100, 1_000, 5_000, 10_000]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'rules':>8} {'build s':>8} {'cold rows/s':>12} {'warm rows/s':>12} {'naive rows/s':>13}"
+    )
+    for n_rules in args.rules:
+        rules = make_rules(n_rules, args.regex_share)
+        records = make_records(rules, args.records, args.merchants)
+
+        start = time.perf_counter()
+        tagger = ExpenseTagger(rules)
+        build = time.perf_counter() - start
+
+        cold = rate(
+            lambda r: tagger.match(
+                normalize_merchant(r["parsed_desc"]["authorization_location"])
+            ),
+            records,
+        )
+        rate(tagger.tag, records)
+        warm = rate(tagger.tag, records)
+
+        compiled = [
+            (
+                tag,
+                re.compile(
+                    p.removeprefix("re:") if p.startswith("re:") else re.escape(p),
+                    flags=re.I,
+                ),
+            )
+            for tag, patterns in rules.items()
+            for p in patterns
+        ]
+        naive = rate(
+            lambda r: naive_tag(compiled, r), records[: max(args.records // 10, 1)]
+        )
+
+        print(
+            f"{n_rules:>8} {build:>8.2f} {cold:>12,.0f} {warm:>12,.0f} {naive:>13,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
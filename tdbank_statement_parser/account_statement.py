@@ -125,8 +125,6 @@ def normalize_account_statement(rec: dict, table_name: str, metadata: dict) -> d
     result = (
         py_(rec).map_values(lambda v, k: normalize_map.get(k, py_.clean)(v)).value()
     )
-    # TODO: Generalize expense tagging.
-    # result['classified_expense'] = auto_find_tag(result)
     trans_type = result["transaction_type"] = (
         py_(parse_config["tables"]).get(table_name).get("transaction_type").value()
     )
@@ -2,6 +2,7 @@
 Automated browser script to download TD Bank account statements.
 """
 
+import json
 import os
 import random
 import re
@@ -10,11 +11,95 @@ from argparse import ArgumentParser
 from pathlib import Path
 
 from faker import Faker
-from playwright.sync_api import Playwright, expect, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import (
+    BrowserContext,
+    Locator,
+    Page,
+    Playwright,
+    expect,
+    sync_playwright,
+)
 
 fake = Faker()
 
 
+def accounts_menu(page: Page) -> Locator:
+    return page.get_by_role("menuitem", name="Accounts").locator("span")
+
+
+def is_logged_in(page: Page, timeout: float) -> bool:
+    try:
+        expect(accounts_menu(page)).to_be_attached(timeout=timeout)
+    except AssertionError:
+        return False
+    return True
+
+
+def save_session(context: BrowserContext, storage_state: Path, user_agent: str) -> None:
+    """Write the user agent and the context's cookies and local storage.
+
+    The file is readable only by the owner. The user agent is kept with the
+    session because banks commonly tie sessions and remembered devices to it.
+    """
+    session = {"user_agent": user_agent, "storage_state": context.storage_state()}
+    fd = os.open(storage_state, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)  # the mode above only applies to newly created files
+    with os.fdopen(fd, "w") as f:
+        json.dump(session, f)
+    print(f"SESSION SAVED: {str(storage_state)}")
+
+
+def open_session(playwright: Playwright, args) -> tuple:
+    """Open a logged in browser session.
+
+    A saved session is tried first in a headless browser with its original user
+    agent. Otherwise (missing, unreadable or expired) a headed browser waits for
+    the user to log in manually, and the resulting session is saved when a path
+    was given. `run` saves it again before closing.
+
+    Returns:
+        tuple: (browser, context, page, user agent) on the accounts dashboard.
+    """
+    storage_state = args.storage_state
+    user_agent = fake.chrome()
+    if storage_state and storage_state.exists():
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            session = json.loads(storage_state.read_text())
+            context = browser.new_context(
+                user_agent=session["user_agent"],
+                storage_state=session["storage_state"],
+            )
+        except (ValueError, KeyError, TypeError, PlaywrightError) as ex:
+            print(f"SESSION UNREADABLE: {str(storage_state)} ({ex})")
+        else:
+            user_agent = session["user_agent"]
+            page = context.new_page()
+            page.goto(args.base_url)
+            if is_logged_in(page, timeout=30_000):
+                print(f"SESSION: {str(storage_state)}")
+                return browser, context, page, user_agent
+            print(f"SESSION EXPIRED: {str(storage_state)}")
+            context.close()
+        browser.close()
+
+    browser = playwright.chromium.launch(headless=False)
+    context = browser.new_context(user_agent=user_agent)
+    page = context.new_page()
+
+    page.goto(args.base_url)
+
+    expect(accounts_menu(page)).to_be_attached(
+        timeout=240_000
+    )  # waits 4 minutes for user to manually login
+    time.sleep(4)
+
+    if storage_state:
+        save_session(context, storage_state, user_agent)
+    return browser, context, page, user_agent
+
+
 def run(playwright: Playwright, args) -> None:
     data_dir = args.output_directory
     audit_file = data_dir / "audit"
@@ -30,18 +115,7 @@ def run(playwright: Playwright, args) -> None:
         audit_file.open("w")
         audit_log = {}
 
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context(user_agent=fake.chrome())
-    page = context.new_page()
-
-    page.goto("https://onlinebanking.tdbank.com/")
-
-    expect(
-        page.get_by_role("menuitem", name="Accounts").locator("span")
-    ).to_be_attached(
-        timeout=240_000
-    )  # waits 4 minutes for user to manually login
-    time.sleep(4)
+    browser, context, page, user_agent = open_session(playwright, args)
 
     account_rows = page.locator("tr.ngp-financial-table-body-row")
 
@@ -58,7 +132,9 @@ def run(playwright: Playwright, args) -> None:
         page.get_by_role("button", name="Statements").click()
         year_select = page.locator("select#docYearValue,select[ng-model='docYear']")
         years = [x.inner_html().strip() for x in year_select.locator("option").all()]
-        for year in years[::-1]:
+        up_to_date = False
+        # Years and months are listed newest first.
+        for year in years if args.incremental else years[::-1]:
             year_select.select_option(year)
             time.sleep(random.uniform(1, 3))
             expect(page.locator(".td-spinner")).to_have_class(
@@ -74,7 +150,8 @@ def run(playwright: Playwright, args) -> None:
                 continue
             year_dir = account_dir / year
             year_dir.mkdir(exist_ok=True)
-            for month_row in month_rows.all()[::-1]:
+            months = month_rows.all()
+            for month_row in months if args.incremental else months[::-1]:
                 elem = month_row.element_handle()
                 month_id = re.sub(r"[\s\W]+", "_", elem.inner_text().strip())
                 record_id = f"{account_id}|{year}|{month_id}"
@@ -91,8 +168,16 @@ def run(playwright: Playwright, args) -> None:
                         audit_file.open("a").write(f"{record_id},{str(file_path)}\n")
                 else:
                     print(f"EXISTS: {audit_log[record_id]}")
-
-        page.get_by_role("menuitem", name="Accounts").locator("span").click()
+                    if args.incremental:
+                        up_to_date = True
+                        break
+            if up_to_date:
+                break
+
+        accounts_menu(page).click()
+    if args.storage_state:
+        # Keep cookies the bank refreshed during the run.
+        save_session(context, args.storage_state, user_agent)
     context.close()
     browser.close()
 
@@ -104,9 +189,28 @@ def main():
     parser.add_argument(
         dest="output_directory",
         nargs="?",
+        type=Path,
         default=Path(os.getcwd()) / "data",
         help="Specify the output directory (defaults to ./data/ otherwise)",
     )
+    parser.add_argument(
+        "-s",
+        "--storage-state",
+        type=Path,
+        default=None,
+        help="Save the logged in session to this file and reuse it headless on later runs",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="Walk statements newest first and stop at the first one already in the audit log",
+    )
+    parser.add_argument(
+        "--base-url",
+        default="https://onlinebanking.tdbank.com/",
+        help="Online banking URL (e.g. a local mock of the statements pages)",
+    )
     args = parser.parse_args()
 
     with sync_playwright() as playwright:
@@ -0,0 +1,180 @@
+"""
+Rule-based expense tagging for parsed statement activity.
+
+Rules are loaded from a JSON file mapping a tag to a list of patterns:
+
+    {
+        "Groceries": ["WHOLEFDS", "TRADER JOE", "re:^SHOPRITE\\b"],
+        "Transport": ["E-ZPASS", "re:\\bUBER\\s+\\*?TRIP\\b"]
+    }
+
+Plain patterns are case-insensitive substring keywords; patterns prefixed with
+`re:` are case-insensitive regular expressions. When several rules match, the
+rule listed first in the file wins.
+"""
+
+import json
+import re
+from collections import deque
+
+REGEX_PREFIX = "re:"
+REGEX_BATCH_SIZE = 50
+
+
+def normalize_merchant(s: str) -> str:
+    return re.sub(r"\s+", " ", s).strip().upper()
+
+
+def build_automaton(keywords: list) -> tuple:
+    """Build an Aho-Corasick automaton over the (rule index, keyword) pairs.
+
+    Returns:
+        tuple: (goto transitions, failure links, lowest rule index ending at each state)
+    """
+    goto, fail, out = [{}], [0], [None]
+    for idx, keyword in keywords:
+        state = 0
+        for ch in keyword:
+            if ch not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                out.append(None)
+                goto[state][ch] = len(goto) - 1
+            state = goto[state][ch]
+        if out[state] is None or idx < out[state]:
+            out[state] = idx
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, child in goto[state].items():
+            queue.append(child)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[child] = goto[f].get(ch, 0)
+            if out[fail[child]] is not None and (
+                out[child] is None or out[fail[child]] < out[child]
+            ):
+                out[child] = out[fail[child]]
+    return goto, fail, out
+
+
+def build_regex_batches(patterns: list) -> list:
+    """Group (rule index, regex) pairs into batches sharing one combined prefilter.
+
+    A batch's combined alternation matches iff one of its patterns does, so most
+    rows are rejected with a single search per batch. Patterns with capture groups
+    get a batch of their own without a prefilter, since combining them would
+    renumber their backreferences. Batches keep the rules' order.
+    """
+    groups = []
+    for idx, rgx in patterns:
+        if rgx.groups:
+            groups.append([(idx, rgx)])
+        elif (
+            groups
+            and not groups[-1][0][1].groups
+            and len(groups[-1]) < REGEX_BATCH_SIZE
+        ):
+            groups[-1].append((idx, rgx))
+        else:
+            groups.append([(idx, rgx)])
+
+    batches = []
+    for batch in groups:
+        combined = None
+        if len(batch) > 1:
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{rgx.pattern})" for _, rgx in batch), flags=re.I
+                )
+            except re.error:
+                pass  # e.g. global inline flags mid-pattern; check patterns one by one
+        batches.append((combined, batch))
+    return batches
+
+
+class ExpenseTagger:
+    """Assign an expense tag to statement records from a set of keyword / regex rules."""
+
+    def __init__(self, rules: dict):
+        """
+        Raises:
+            ValueError: A tag's rules are not a list of strings, or a `re:` pattern
+                does not compile.
+        """
+        self.tags = []
+        keywords, patterns = [], []
+        for tag, rule_patterns in rules.items():
+            if not isinstance(rule_patterns, list) or not all(
+                isinstance(x, str) for x in rule_patterns
+            ):
+                raise ValueError(f"Rules for tag {tag!r} must be a list of strings.")
+            for pattern in rule_patterns:
+                idx = len(self.tags)
+                self.tags.append(tag)
+                if pattern.startswith(REGEX_PREFIX):
+                    try:
+                        rgx = re.compile(pattern[len(REGEX_PREFIX) :], flags=re.I)
+                    except re.error as ex:
+                        raise ValueError(
+                            f"Invalid regular expression {pattern!r} for tag {tag!r}: {ex}"
+                        ) from ex
+                    patterns.append((idx, rgx))
+                elif keyword := normalize_merchant(pattern):
+                    keywords.append((idx, keyword))
+        self.automaton = build_automaton(keywords)
+        self.regex_batches = build_regex_batches(patterns)
+        self.cache = {}
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "ExpenseTagger":
+        with open(filepath, "r") as f:
+            return cls(json.load(f))
+
+    def match(self, merchant: str) -> int:
+        """Return the lowest index of a rule matching the normalized merchant string."""
+        goto, fail, out = self.automaton
+        best = None
+        state = 0
+        for ch in merchant:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] is not None and (best is None or out[state] < best):
+                best = out[state]
+
+        for combined, batch in self.regex_batches:
+            if best is not None and batch[0][0] >= best:
+                break
+            if combined and not combined.search(merchant):
+                continue
+            for idx, rgx in batch:
+                if best is not None and idx >= best:
+                    break
+                if rgx.search(merchant):
+                    best = idx
+                    break
+        return best
+
+    def tag(self, record: dict) -> str:
+        """Tag a normalized statement record.
+
+        Matches against the parsed `authorization_location` when available and
+        the full `description` otherwise. Tags are cached per merchant string.
+
+        Returns:
+            str: The tag of the first matching rule, or None.
+        """
+        merchant = normalize_merchant(
+            (record.get("parsed_desc") or {}).get("authorization_location")
+            or record.get("description")
+            or ""
+        )
+        if not merchant:
+            return None
+        if merchant not in self.cache:
+            idx = self.match(merchant)
+            self.cache[merchant] = self.tags[idx] if idx is not None else None
+        return self.cache[merchant]
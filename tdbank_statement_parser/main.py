@@ -1,20 +1,66 @@
 import fileinput
 import json
 import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from glob import glob
 
 from pydash import py_
 
+from tdbank_statement_parser.expense_tagger import ExpenseTagger
 from tdbank_statement_parser.parser import parse
 
 
 def main():
+    parser = ArgumentParser(
+        description="TD Bank statement parser.",
+    )
+    parser.add_argument(
+        dest="paths",
+        nargs="*",
+        help="Paths to PDF statements (read from stdin otherwise)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Extract and scan the pages of long statements across a pool of this many "
+            "processes, shared by all files; short statements are parsed in-process"
+        ),
+    )
+    parser.add_argument(
+        "-t",
+        "--tag-rules",
+        default=None,
+        help="JSON file of expense tagging rules; adds `classified_expense` to each record",
+    )
+    parser.add_argument(
+        "-k",
+        "--skip-pages",
+        action="store_true",
+        help=(
+            "Experimental: skip extracting legal and disclosure pages without "
+            "activity tables; check results with --validate first"
+        ),
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Skip pages as --skip-pages does, and report files whose output differs from parsing every page",
+    )
+    args = parser.parse_args()
+    skip_pages = args.skip_pages or args.validate
+    tagger = ExpenseTagger.from_file(args.tag_rules) if args.tag_rules else None
+
     if not (
         input_paths := [
             y
-            for x in (py_.tail(sys.argv) or fileinput.input())
+            for x in (args.paths or fileinput.input(files=["-"]))
             if x.strip() and x.strip().endswith(".pdf")
-            for y in glob(x)
+            for y in glob(x.strip())
         ]
     ):
         print(
@@ -28,17 +74,53 @@ def main():
             file=sys.stderr,
         )
 
-        for p in sorted(input_paths):
-            record = parse(p)
-            print(json.dumps(record, default=str), file=sys.stdout)
+        mismatches = []
+        with (
+            ProcessPoolExecutor(max_workers=args.workers)
+            if args.workers and args.workers > 1
+            else nullcontext()
+        ) as executor:
+            for p in sorted(input_paths):
+                record = parse(
+                    p, executor=executor, tagger=tagger, skip_pages=skip_pages
+                )
+                print(json.dumps(record, default=str), file=sys.stdout)
+                print(
+                    {
+                        "message": "Processed file.",
+                        "filepath": p,
+                        "counts": {
+                            k: len(v) for k, v in record["activity"].items() if v
+                        },
+                        "pages_skipped": record["nPagesSkipped"],
+                    },
+                    file=sys.stderr,
+                )
+                if args.validate:
+                    full_record = parse(p, executor=executor, tagger=tagger)
+                    if py_.omit(record, "nPagesSkipped") != py_.omit(
+                        full_record, "nPagesSkipped"
+                    ):
+                        mismatches.append(p)
+                        print(
+                            {
+                                "error": "Output differs when skipping pages.",
+                                "filepath": p,
+                            },
+                            file=sys.stderr,
+                        )
+
+        if args.validate:
             print(
                 {
-                    "message": "Processed file.",
-                    "filepath": p,
-                    "counts": {k: len(v) for k, v in record["activity"].items() if v},
+                    "message": "Validated page skipping.",
+                    "files": len(input_paths),
+                    "mismatches": len(mismatches),
                 },
                 file=sys.stderr,
             )
+            if mismatches:
+                sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import Executor
 from hashlib import md5
 from pathlib import Path
 
@@ -9,6 +10,10 @@ from pydash import py_
 
 from .account_statement import parse_config as account_parse_config
 from .credit_card_statement import parse_config as credit_card_parse_config
+from .expense_tagger import ExpenseTagger
+
+# Pages extracted per worker task; statements no longer than this are parsed in-process.
+pages_per_task = 10
 
 table_cutoff = re.compile(
     r"(^\s+Subtotal\:\s+[\d\,\.]*\s*$|"
@@ -18,29 +23,94 @@ table_cutoff = re.compile(
 )
 
 
-def parse_lines(parse_config: dict, lines: list) -> dict:
+def find_table(tables: dict, line: str) -> dict:
+    """Return the configuration of the first table whose heading matches the line."""
+    return (
+        py_(tables.values())
+        .filter(lambda x: re.search(x["table_name_re"], line, flags=re.I))
+        .head()
+        .value()
+    )
+
+
+def scan_line(tables: dict, line: str) -> tuple:
+    """Evaluate the patterns the table walker may consult for a single line.
+
+    Scanning has no dependency on neighbouring lines, so pages can be scanned
+    independently (and concurrently) before `parse_lines` stitches them together.
+
+    Args:
+        tables (dict): The `tables` section of a parse configuration.
+        line (str): A single line of PDF text.
+
+    Returns:
+        tuple: (
+            cutoff: bool,             # Line ends the current table
+            header: str | None,       # Name of the first table whose heading matches
+            rows: dict[str -> dict],  # Captured row fields per matching `table_row` pattern
+        ), or None when nothing matches.
+    """
+    if not line.strip():
+        return None
+    cutoff = bool(table_cutoff.search(line))
+    header = (find_table(tables, line) or {}).get("table_name")
+    rows = {}
+    for rgx in {x["table_row"] for x in tables.values()}:
+        if m := rgx.search(line):
+            rows[rgx.pattern] = m.groupdict()
+    if cutoff or header or rows:
+        return cutoff, header, rows
+
+
+def parse_lines(parse_config: dict, lines: list, scans: list = None) -> dict:
     """With the given configuration, parse tables and metadata from the list of text lines.
 
     Args:
         parse_config (dict): Defines how to extract elements (see ./*_statement.py).
         lines (list): The PDF text contents as a list of strings.
+        scans (list, optional): Precomputed `scan_line` results, one per line.
+            Patterns are matched lazily against `lines` when omitted.
 
     Returns:
         dict: Structured statement activity tables.
     """
+    if scans is None:
+
+        def is_cutoff(n):
+            return table_cutoff.search(lines[n])
+
+        def header_config(n):
+            return find_table(parse_config["tables"], lines[n])
+
+        def row_match(n, config):
+            if m := config["table_row"].search(lines[n]):
+                return m.groupdict()
+
+    else:
+        tables = {x["table_name"]: x for x in parse_config["tables"].values()}
+
+        def is_cutoff(n):
+            return scans[n] and scans[n][0]
+
+        def header_config(n):
+            return scans[n] and tables.get(scans[n][1])
+
+        def row_match(n, config):
+            return scans[n] and scans[n][2].get(config["table_row"].pattern)
+
     n = 0
     config = None
     data = defaultdict(list)
     while n < len(lines):
         if lines[n].strip():
             if config:
-                if table_cutoff.search(lines[n]):
+                if is_cutoff(n):
                     config = None
                     n += 1
                     continue
                 else:
-                    if m := config["table_row"].search(lines[n]):
-                        data[config["table_name"]].append(m.groupdict())
+                    if (row := row_match(n, config)) is not None:
+                        data[config["table_name"]].append(row)
                     else:
                         try:
                             if "description" in data[config["table_name"]][-1]:
@@ -62,12 +132,7 @@ def parse_lines(parse_config: dict, lines: list) -> dict:
                                 },
                                 file=sys.stdout,
                             )
-            if (
-                found_config := py_(parse_config["tables"].values())
-                .filter(lambda x: re.search(x["table_name_re"], lines[n], flags=re.I))
-                .head()
-                .value()
-            ):
+            if found_config := header_config(n):
                 config = found_config
                 if "Interest Charge Calculation" in config.get("table_name", ""):
                     w = 3
@@ -93,32 +158,166 @@ def get_content_type_config(text: str) -> dict:
     raise Exception("Cannot discern content-type of the file.")
 
 
-def parse(filepath: str) -> dict:
+def scan_pages(filepath: str, tables: dict, page_numbers: list) -> list:
+    """Extract and scan pages with a dedicated pdftotext handle.
+
+    Args:
+        filepath (str): The file path to a TD Bank statement.
+        tables (dict): The `tables` section of a parse configuration.
+        page_numbers (list): Indexes of the pages to extract, in order.
+
+    Returns:
+        list: [(page text, [scan_line result for each line of the page])]
+    """
+    with open(filepath, "rb") as f:
+        pdf = pdftotext.PDF(f, physical=True)
+        pages = [pdf[i] for i in page_numbers]
+    return [
+        (page, [scan_line(tables, line) for line in page.splitlines()])
+        for page in pages
+    ]
+
+
+def extract_pages_parallel(
+    filepath: str, tables: dict, page_numbers: list, executor: Executor
+) -> tuple:
+    """Extract and scan the pages of a statement across worker processes.
+
+    Pages are split into contiguous ranges of `pages_per_task` and reassembled in
+    order. Table state spanning page boundaries is left to `parse_lines`, which
+    walks the combined lines exactly as it would for a sequential extraction.
+
+    Args:
+        filepath (str): The file path to a TD Bank statement.
+        tables (dict): The `tables` section of a parse configuration.
+        page_numbers (list): Indexes of the pages to extract, in order.
+        executor (Executor): A process pool shared across statements.
+
+    Returns:
+        tuple: (page texts, scan_line results for the lines of each page)
+    """
+    futures = [
+        executor.submit(
+            scan_pages, filepath, tables, page_numbers[i : i + pages_per_task]
+        )
+        for i in range(0, len(page_numbers), pages_per_task)
+    ]
+    pages = [page for future in futures for page in future.result()]
+    return [text for text, _ in pages], [page_scans for _, page_scans in pages]
+
+
+def row_probe(rgx: re.Pattern) -> str:
+    """Loosen a `table_row` pattern for probing raw-mode text.
+
+    Raw mode does not keep the physical column spacing, so runs of whitespace are
+    relaxed to any amount of spaces or tabs (never newlines), and named groups are
+    dropped so the patterns can share one alternation.
+    """
+    pattern = re.sub(r"\(\?P<\w+>", "(?:", rgx.pattern)
+    pattern = re.sub(r"(\\s| )\{\d+,\d*\}", r"\1+", pattern)
+    return pattern.replace(r"\s", r"[ \t]")
+
+
+def select_pages(filepath: str, parse_config: dict) -> list:
+    """Pick the pages worth a full physical-layout extraction (experimental).
+
+    Each page is probed with pdftotext's raw mode for a line starting with any
+    configured table heading (`table_name_re`, case-insensitive like `find_table`)
+    or shaped like a table row (`row_probe`), which keeps continuation pages
+    without a repeated heading. The first page, which holds the statement
+    metadata, is always selected; legal and disclosure pages are not. Whether
+    raw-mode text keeps these lines intact has not been confirmed on real
+    statements, so check results with `main.py --validate`.
+
+    Args:
+        filepath (str): The file path to a TD Bank statement.
+        parse_config (dict): Defines how to extract elements (see ./*_statement.py).
+
+    Returns:
+        list: Indexes of the selected pages, in order.
+    """
+    tables = parse_config["tables"].values()
+    probe = re.compile(
+        "|".join(
+            [rf"^[ \t]*(?:{x['table_name_re'].lstrip('^')})" for x in tables]
+            + [f"(?:{row_probe(rgx)})" for rgx in {x["table_row"] for x in tables}]
+        ),
+        flags=re.M | re.I,
+    )
+    with open(filepath, "rb") as f:
+        pdf = pdftotext.PDF(f, raw=True)
+        return [0] + [i for i in range(1, len(pdf)) if probe.search(pdf[i])]
+
+
+def parse(
+    filepath: str,
+    executor: Executor = None,
+    tagger: ExpenseTagger = None,
+    skip_pages: bool = False,
+) -> dict:
     """Parse a TD Bank statement into logical parts.
 
     Args:
         filepath (str): The file path to a TD Bank credit card or account statement.
+        executor (Executor, optional): A process pool to extract and scan the pages
+            of statements longer than `pages_per_task` across. Output is identical
+            to the default sequential parsing.
+        tagger (ExpenseTagger, optional): Adds a `classified_expense` tag to each record
+            with a `description`.
+        skip_pages (bool, optional): Experimental. Only extract pages holding metadata
+            or activity tables (see `select_pages`).
 
     Returns:
         dict: {
             file_md5: str,
             filename: str,
             nPages: int,
+            nPagesSkipped: int,
             metadata: dict[str -> any],
             activity: dict[str -> [dict]]   # Tabular data defined in parse_config.tables
         }
     """
-    parsed_pdf = list(pdftotext.PDF(open(filepath, "rb"), physical=True))
-    content_parse_config = get_content_type_config(parsed_pdf[0])
+    with open(filepath, "rb") as f:
+        pdf = pdftotext.PDF(f, physical=True)
+        n_pages = len(pdf)
+        first_page = pdf[0]
+        content_parse_config = get_content_type_config(first_page)
+
+        if skip_pages:
+            page_numbers = select_pages(filepath, content_parse_config)
+        else:
+            page_numbers = list(range(n_pages))
+
+        if executor and len(page_numbers) > pages_per_task:
+            parsed_pdf, page_scans = extract_pages_parallel(
+                filepath, content_parse_config["tables"], page_numbers, executor
+            )
+        else:
+            parsed_pdf = [first_page] + [pdf[i] for i in page_numbers[1:]]
+            page_scans = None
+
+    # Skipped pages hold no tables; a blank line in their place closes any open
+    # table just as their own text would.
+    lines = []
+    scans = [] if page_scans else None
+    for n, page in enumerate(parsed_pdf):
+        if n and page_numbers[n] != page_numbers[n - 1] + 1:
+            lines.append("")
+            if page_scans:
+                scans.append(scan_line(content_parse_config["tables"], ""))
+        lines.extend(page.splitlines())
+        if page_scans:
+            scans.extend(page_scans[n])
 
     normalize = content_parse_config.get("normalize", py_.identity)
 
-    activity_tables = dict(
-        parse_lines(
-            content_parse_config,
-            list(line for page in parsed_pdf for line in page.splitlines()),
-        )
-    )
+    def normalize_record(record: dict, table_name: str) -> dict:
+        result = normalize(record, table_name, metadata)
+        if tagger and result.get("description"):
+            result["classified_expense"] = tagger.tag(result)
+        return result
+
+    activity_tables = dict(parse_lines(content_parse_config, lines, scans))
 
     metadata = {}
     if metadata_patterns := content_parse_config.get("metadata_patterns"):
@@ -133,11 +332,12 @@ def parse(filepath: str) -> dict:
     return {
         "file_md5": md5(open(filepath, "rb").read()).hexdigest(),
         "filename": Path(filepath).name,
-        "nPages": len(parsed_pdf),
+        "nPages": n_pages,
+        "nPagesSkipped": n_pages - len(page_numbers),
         "metadata": metadata,
         "activity": {
             table_name: list(
-                map(lambda x: normalize(x, table_name, metadata), records_list)
+                map(lambda x: normalize_record(x, table_name), records_list)
             )
             for table_name, records_list in activity_tables.items()
         },